@@ -6,10 +6,11 @@ import matplotlib.pyplot as plt
 # Importamos nuestra librería personalizada
 from ctg_viz.preprocessing import remove_null_columns, impute_missing_values, detect_handle_outliers
 from ctg_viz.utils import check_data_completeness_JosueJimenezApodaca
+from ctg_viz.summary import build_summary_cube
 from ctg_viz.plots.histograms import plot_histogram_interactivo
 from ctg_viz.plots.boxplots import plot_boxplot
 from ctg_viz.plots.barplots import plot_bar
-from ctg_viz.plots.heatmap import plot_correlation_heatmap
+from ctg_viz.plots.heatmap import plot_correlation_heatmap, get_variable_blocks
 from ctg_viz.plots.density import plot_violin
 
 # Configuración de la página (Título y Layout ancho)
@@ -69,6 +70,14 @@ reporte = check_data_completeness_JosueJimenezApodaca(df_final)
 vars_continuas = reporte[reporte['Categoría Auto'] == 'Continua'].index.tolist()
 vars_discretas = reporte[reporte['Categoría Auto'] == 'Discreta'].index.tolist()
 
+# Cubo de resúmenes: se calcula una vez por dataset y los gráficos sólo lo consultan.
+# cache_resource lo comparte sin copiarlo en cada rerun (el cubo nunca se modifica)
+@st.cache_resource
+def get_summary_cube(data, continuas, discretas):
+    return build_summary_cube(data, continuous=continuas, discrete=discretas)
+
+cube = get_summary_cube(df_final, vars_continuas, vars_discretas)
+
 # --- PESTAÑAS PRINCIPALES ---
 tab1, tab2, tab3 = st.tabs(["📊 Resumen de Datos", "🧹 Calidad & Outliers", "📈 Visualización Interactiva"])
 
@@ -153,7 +162,7 @@ with tab3:
         # Agregamos [None] por si el usuario no quiere agrupar
         group = st.selectbox("Agrupar por (Discreta/Categórica)", [None] + vars_discretas)
         
-        fig = plot_histogram_interactivo(df_final, col=col_dist, group_by=group)
+        fig = plot_histogram_interactivo(df_final, col=col_dist, group_by=group, cube=cube)
         st.plotly_chart(fig, use_container_width=True)
 
     elif plot_type == "Boxplot":
@@ -164,26 +173,44 @@ with tab3:
         # Facet: Discretas
         facet = st.selectbox("Separar por (Facet - Opcional)", [None] + vars_discretas)
         
-        fig = plot_boxplot(df_final, x=col_x, y=col_y, facet_col=facet)
+        fig = plot_boxplot(df_final, x=col_x, y=col_y, facet_col=facet, cube=cube)
         st.plotly_chart(fig, use_container_width=True)
 
     elif plot_type == "Violin Plot":
         col_v_y = st.selectbox("Variable Y (Continua)", vars_continuas)
         col_v_x = st.selectbox("Variable X (Discreta)", vars_discretas)
-        fig = plot_violin(df_final, x=col_v_x, y=col_v_y)
+        puntos = st.checkbox("Mostrar puntos", value=True)
+        fig = plot_violin(df_final, x=col_v_x, y=col_v_y, cube=cube, points=puntos)
         st.plotly_chart(fig, use_container_width=True)
 
     elif plot_type == "Barras":
         # Las barras son inherentemente para contar variables DISCRETAS
         col_bar = st.selectbox("Variable Categórica", vars_discretas)
         horiz = st.checkbox("Horizontal", value=True)
-        fig = plot_bar(df_final, col=col_bar, horizontal=horiz)
+        fig = plot_bar(df_final, col=col_bar, horizontal=horiz, cube=cube)
         st.plotly_chart(fig, use_container_width=True)
 
     elif plot_type == "Heatmap Correlación":
         method = st.radio("Método de Correlación", ["pearson", "spearman"])
-        # El heatmap usa todo el dataframe numérico, no requiere inputs
-        fig = plot_correlation_heatmap(df_final, method=method)
+        # Opciones para muchas variables: umbral de |r| y agregación por bloques
+        threshold = st.slider("Ocultar correlaciones con |r| menor a", 0.0, 1.0, 0.0, 0.05)
+        # 0 = automático: se agrupa sólo si hay más variables de las que caben en la figura
+        block_input = st.number_input("Variables por bloque (0 = automático, 1 = sin agrupar)", min_value=0, value=0)
+        block_size = int(block_input) if block_input > 0 else None
+        drilldown = None
+        blocks = get_variable_blocks(df_final, block_size)
+        if any(len(b) > 1 for b in blocks):
+            labels = [f"{i}: {b[0]}…{b[-1]}" for i, b in enumerate(blocks)]
+            if st.checkbox("Detallar cruce de bloques"):
+                row_block = st.selectbox("Bloque filas", range(len(blocks)), format_func=lambda i: labels[i])
+                col_block = st.selectbox("Bloque columnas", range(len(blocks)), format_func=lambda i: labels[i])
+                drilldown = (row_block, col_block)
+        fig = plot_correlation_heatmap(
+            df_final, method=method,
+            block_size=block_size,
+            threshold=threshold if threshold > 0 else None,
+            drilldown=drilldown
+        )
         st.plotly_chart(fig, use_container_width=True)
 
 # Pie de página
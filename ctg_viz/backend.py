@@ -0,0 +1,73 @@
+import pandas as pd
+
+def is_arrow(series: pd.Series) -> bool:
+    """
+    Indica si una columna está respaldada por Arrow
+    (`pd.ArrowDtype` o `string[pyarrow]`, el `str` de pandas 3).
+
+    Args:
+        series (pd.Series): Columna a revisar.
+    Returns:
+        bool: True si sus datos viven en un arreglo de pyarrow.
+    """
+    dtype = series.dtype
+    return isinstance(dtype, pd.ArrowDtype) or (
+        isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+    )
+
+def arrow_array(series: pd.Series):
+    """
+    Obtiene el arreglo de pyarrow detrás de una columna Arrow (sin copiar los buffers).
+
+    Args:
+        series (pd.Series): Columna Arrow.
+    Returns:
+        pyarrow.Array: Arreglo con los datos de la columna.
+    """
+    import pyarrow as pa
+    return pa.array(series)
+
+def from_arrow(array, like: pd.Series) -> pd.Series:
+    """
+    Envuelve un resultado de `pyarrow.compute` como Serie con el índice y
+    nombre de `like`. Las columnas `string[pyarrow]` conservan su tipo.
+
+    Args:
+        array (pyarrow.Array): Resultado de un kernel de Arrow.
+        like (pd.Series): Columna original.
+    Returns:
+        pd.Series: Serie respaldada por Arrow.
+    """
+    result = pd.Series(pd.arrays.ArrowExtensionArray(array), index=like.index, name=like.name)
+    if isinstance(like.dtype, pd.StringDtype):
+        result = result.astype(like.dtype)
+    return result
+
+def null_count(series: pd.Series) -> int:
+    """
+    Cuenta nulos. En columnas Arrow se lee el conteo guardado en los
+    metadatos del buffer (sin recorrer los datos).
+
+    Args:
+        series (pd.Series): Columna a revisar.
+    Returns:
+        int: Número de valores nulos.
+    """
+    if is_arrow(series):
+        return arrow_array(series).null_count
+    return int(series.isnull().sum())
+
+def nunique(series: pd.Series) -> int:
+    """
+    Cuenta valores únicos (sin nulos). En columnas Arrow usa el kernel
+    `count_distinct` en lugar de la ruta de objetos de pandas.
+
+    Args:
+        series (pd.Series): Columna a revisar.
+    Returns:
+        int: Número de valores distintos.
+    """
+    if is_arrow(series):
+        import pyarrow.compute as pc
+        return pc.count_distinct(arrow_array(series), mode="only_valid").as_py()
+    return series.nunique()
@@ -1,8 +1,9 @@
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+from typing import Optional
 
-def plot_bar(df: pd.DataFrame, col: str, horizontal: bool = False) -> go.Figure:
+def plot_bar(df: pd.DataFrame, col: str, horizontal: bool = False, cube: Optional[dict] = None) -> go.Figure:
     """
     Gráfico de barras interactivo ordenado por frecuencia.
     Se utiliza para variables categóricas/discretas.
@@ -12,11 +13,16 @@ def plot_bar(df: pd.DataFrame, col: str, horizontal: bool = False) -> go.Figure:
         df (pd.DataFrame): Dataset con la variable a graficar.
         col (str): Nombre de la columna categórica/discreta.
         horizontal (bool): Si es True, el gráfico será horizontal. Default es False (vertical). 
+        cube (dict, optional): Cubo de `build_summary_cube`. Si contiene la variable,
+                               se usan sus frecuencias precalculadas.
     Returns:
         go.Figure: Gráfico de barras ordenado por frecuencia.
     """
 
-    counts = df[col].value_counts().reset_index()
+    if cube is not None and col in cube["value_counts"]:
+        counts = cube["value_counts"][col].reset_index()
+    else:
+        counts = df[col].value_counts().reset_index()
     counts.columns = ['Categoría', 'Frecuencia']
     counts = counts.sort_values(by='Frecuencia', ascending=True if horizontal else False)
     
@@ -3,7 +3,41 @@ import plotly.graph_objects as go
 import pandas as pd
 from typing import Optional
 
-def plot_boxplot(df: pd.DataFrame, x: str, y: str, facet_col: Optional[str] = None) -> go.Figure:
+def _plot_boxplot_from_cube(cube: dict, x: str, y: str) -> go.Figure:
+    """
+    Helper interno que dibuja el boxplot a partir de los cuartiles y bigotes
+    precalculados en el cubo, sin volver a agrupar el dataset.
+    """
+    stats = cube["stats"][(y, x)]
+    outliers = cube["outliers"][(y, x)]
+    colors = px.colors.qualitative.Plotly
+
+    fig = go.Figure()
+    for i, (group, row) in enumerate(stats.iterrows()):
+        color = colors[i % len(colors)]
+        fig.add_trace(go.Box(
+            x=[str(group)],
+            q1=[row["q1"]], median=[row["median"]], q3=[row["q3"]],
+            lowerfence=[row["lowerfence"]], upperfence=[row["upperfence"]],
+            name=str(group), legendgroup=str(group),
+            marker_color=color
+        ))
+        if group in outliers:
+            # Outliers como puntos (equivalente a points="outliers")
+            fig.add_trace(go.Scatter(
+                x=[str(group)] * len(outliers[group]), y=outliers[group],
+                mode="markers", name=str(group), legendgroup=str(group),
+                showlegend=False, marker_color=color
+            ))
+
+    fig.update_layout(
+        title=f"Distribución de {y} por {x}",
+        xaxis_title=x, yaxis_title=y, legend_title_text=x,
+        template="plotly_white"
+    )
+    return fig
+
+def plot_boxplot(df: pd.DataFrame, x: str, y: str, facet_col: Optional[str] = None, cube: Optional[dict] = None) -> go.Figure:
     """
     Boxplot interactivo con opción de faceting (subgráficos).
     Permite visualizar la distribución de una variable numérica (y)
@@ -15,9 +49,15 @@ def plot_boxplot(df: pd.DataFrame, x: str, y: str, facet_col: Optional[str] = No
         x (str): Variable categórica (Eje X).
         y (str): Variable numérica (Eje Y).
         facet_col (str, optional): Variable para dividir en columnas.
+        cube (dict, optional): Cubo de `build_summary_cube`. Sin faceting se usan
+                               sus estadísticos precalculados del par (y, x).
     Returns:
         go.Figure: Gráfico de boxplot interactivo.
     """
+    # El cubo sólo cubre pares (continua x discreta); el faceting agrupa por tres
+    if cube is not None and facet_col is None and (y, x) in cube["stats"]:
+        return _plot_boxplot_from_cube(cube, x, y)
+
     fig = px.box(
         df, 
         x=x, 
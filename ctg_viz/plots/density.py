@@ -1,25 +1,91 @@
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
+from typing import Optional
 
-def plot_violin(df: pd.DataFrame, x: str, y: str) -> go.Figure:
+def _plot_violin_from_cube(cube: dict, x: str, y: str, df: Optional[pd.DataFrame] = None) -> go.Figure:
+    """
+    Helper interno que dibuja el violin a partir de la densidad (KDE) y de los
+    cuartiles precalculados de cada grupo. Si se pasa `df` se agregan los
+    puntos individuales con todas sus columnas en el hover, como `points="all"`.
+    """
+    grid = cube["density_grid"][y]
+    densities = cube["densities"][(y, x)]
+    stats = cube["stats"][(y, x)]
+    colors = px.colors.qualitative.Plotly
+    peak = np.nanmax(densities.to_numpy()) if densities.notna().any().any() else 1.0
+    rng = np.random.default_rng(0)
+
+    fig = go.Figure()
+    for i, group in enumerate(densities.index):
+        color = colors[i % len(colors)]
+        name = str(group)
+        density = densities.loc[group].to_numpy()
+        inside = np.isfinite(density)
+        values, half_width = grid[inside], 0.4 * density[inside] / peak
+        row = stats.loc[group]
+
+        # Contorno: lado derecho de abajo hacia arriba y lado izquierdo de regreso
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([i + half_width, (i - half_width)[::-1]]),
+            y=np.concatenate([values, values[::-1]]),
+            customdata=np.concatenate([density[inside], density[inside][::-1]]),
+            fill="toself", mode="lines", line_color=color, opacity=0.6,
+            name=name, legendgroup=name,
+            hovertemplate=f"{x}={name}<br>{y}=%{{y:.4g}}<br>densidad=%{{customdata:.4g}}<extra></extra>"
+        ))
+        fig.add_trace(go.Box(
+            x=[i], q1=[row["q1"]], median=[row["median"]], q3=[row["q3"]],
+            lowerfence=[row["lowerfence"]], upperfence=[row["upperfence"]],
+            width=0.1, name=name, legendgroup=name, showlegend=False, marker_color=color
+        ))
+
+        if df is not None:
+            points = df[df[x] == group]
+            columns = list(points.columns)
+            fig.add_trace(go.Scatter(
+                x=i + rng.uniform(-0.3, 0.3, len(points)), y=points[y],
+                customdata=points.to_numpy(), mode="markers",
+                marker=dict(color=color, size=4, opacity=0.5),
+                name=name, legendgroup=name, showlegend=False,
+                hovertemplate="<br>".join(f"{c}=%{{customdata[{j}]}}" for j, c in enumerate(columns)) + "<extra></extra>"
+            ))
+
+    fig.update_layout(
+        title=f"Densidad y Dispersión de {y} por {x}",
+        xaxis=dict(title=x, tickvals=list(range(len(densities))), ticktext=[str(g) for g in densities.index]),
+        yaxis_title=y,
+        legend_title_text=x,
+        template="plotly_white"
+    )
+    return fig
+
+def plot_violin(df: pd.DataFrame, x: str, y: str, cube: Optional[dict] = None, points: bool = True) -> go.Figure:
     """
     Permite crear un violin plot interactivo que muestra la densidad y los puntos subyacentes.
+    Si se pasa un cubo, la densidad (KDE) y la caja se toman de lo precalculado
+    y sólo los puntos, si se piden, se leen del DataFrame.
     
     Args:
         df (pd.DataFrame): Dataset con los datos.
         x (str): Nombre de la columna categórica para el eje X.
         y (str): Nombre de la columna numérica para el eje Y.
+        cube (dict, optional): Cubo de `build_summary_cube`.
+        points (bool): Si es True se dibujan todos los puntos con sus columnas en el hover.
     Returns:
         go.Figure: Objeto de figura de Plotly con el violin plot.
     """
+    if cube is not None and (y, x) in cube["densities"]:
+        return _plot_violin_from_cube(cube, x, y, df if points else None)
+
     fig = px.violin(
         df, 
         y=y, 
         x=x, 
         color=x, 
         box=True, 
-        points="all",
+        points="all" if points else False,
         hover_data=df.columns,
         title=f"Densidad y Dispersión de {y} por {x}",
         template="plotly_white"
@@ -1,25 +1,145 @@
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
-from typing import Optional
+import numpy as np
+import warnings
+from typing import List, Optional, Tuple
 
-def plot_correlation_heatmap(df: pd.DataFrame, method: str = 'pearson') -> go.Figure:
+def _effective_block_size(n_vars: int, block_size: Optional[int], max_vars: int) -> int:
+    """
+    Helper interno: tamaño de bloque a usar. Si no se indica y hay más de
+    `max_vars` variables, se elige el mínimo que deja la matriz en `max_vars` celdas por lado.
+    """
+    if block_size is not None:
+        return max(1, block_size)
+    return max(1, int(np.ceil(n_vars / max_vars)))
+
+def get_variable_blocks(df: pd.DataFrame, block_size: Optional[int] = None, max_vars: int = 100) -> List[List[str]]:
+    """
+    Divide las variables numéricas en bloques consecutivos, en el mismo orden
+    que usa `plot_correlation_heatmap` al agregar. Sirve para elegir el bloque
+    a detallar (drill-down).
+
+    Args:
+        df (pd.DataFrame): Datos.
+        block_size (int, optional): Variables por bloque. None = automático según `max_vars`.
+        max_vars (int): Máximo de bloques por lado en modo automático.
+    Returns:
+        list: Lista de bloques, cada uno con los nombres de sus variables.
+    """
+    cols = df.select_dtypes(include=['number']).columns.tolist()
+    block_size = _effective_block_size(len(cols), block_size, max_vars)
+    return [cols[i:i + block_size] for i in range(0, len(cols), block_size)]
+
+def _aggregate_blocks(corr: np.ndarray, block_size: int, agg: str) -> np.ndarray:
+    """
+    Helper interno que resume la matriz de correlación por bloques de variables
+    con una sola operación vectorizada (reshape a 4 dimensiones).
+    La diagonal (cada variable consigo misma) no cuenta en el resumen.
+    - 'mean': correlación promedio del bloque.
+    - 'max_abs': correlación de mayor magnitud (con su signo).
+    """
+    n = corr.shape[0]
+    n_blocks = int(np.ceil(n / block_size))
+    padded = np.full((n_blocks * block_size, n_blocks * block_size), np.nan, dtype=np.float32)
+    padded[:n, :n] = corr
+    np.fill_diagonal(padded, np.nan)
+    blocks = padded.reshape(n_blocks, block_size, n_blocks, block_size)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # Bloques completamente vacíos (NaN)
+        if agg == 'mean':
+            return np.nanmean(blocks, axis=(1, 3)).astype(np.float32)
+        if agg == 'max_abs':
+            high = np.nanmax(blocks, axis=(1, 3))
+            low = np.nanmin(blocks, axis=(1, 3))
+            return np.where(np.abs(low) > np.abs(high), low, high).astype(np.float32)
+    raise ValueError(f"Agregación no soportada: {agg}. Usa 'mean' o 'max_abs'.")
+
+def plot_correlation_heatmap(
+    df: pd.DataFrame,
+    method: str = 'pearson',
+    block_size: Optional[int] = None,
+    block_agg: str = 'mean',
+    threshold: Optional[float] = None,
+    drilldown: Optional[Tuple[int, int]] = None,
+    max_vars: int = 100
+) -> go.Figure:
     """
     Genera un Heatmap interactivo de correlación optimizado para muchas variables.
     Optimiza el tamaño dinámicamente según la cantidad de variables.
     Permite elegir el método de correlación.
     
+    Para matrices grandes la figura se mantiene acotada:
+    - La matriz se envía como float32 (la mitad de bytes que float64).
+    - Si hay más de `max_vars` variables (o se indica `block_size`) se agregan
+      en bloques de variables consecutivas.
+    - Con `threshold` se ocultan las correlaciones débiles (antes de agregar) y,
+      sin bloques, se descartan las variables sin ninguna correlación fuerte.
+    - Con `drilldown` se muestra a resolución completa el cruce de dos bloques.
+
     Args:
         df (pd.DataFrame): Datos.
         method (str): Método de correlación ('pearson', 'spearman').
+        block_size (int, optional): Variables por bloque. None = automático según `max_vars`.
+        block_agg (str): Resumen de cada bloque: 'mean' o 'max_abs'.
+        threshold (float, optional): |r| mínimo para mostrar una celda.
+        drilldown (tuple, optional): (bloque fila, bloque columna) a detallar,
+                                     con los índices de `get_variable_blocks`.
+        max_vars (int): Máximo de filas/columnas mostradas antes de agregar.
         
     Returns:
         go.Figure: Objeto figura de Plotly listo para Streamlit.
     """
     # Filtrar solo numéricos
-    corr_matrix = df.select_dtypes(include=['number']).corr(method=method).round(2)
+    corr_matrix = df.select_dtypes(include=['number']).corr(method=method).round(2).astype(np.float32)
+    title = f"Matriz de Correlación Interactiva ({method.capitalize()})"
+    n_numeric = len(corr_matrix)
     
-    dynamic_height = max(600, len(corr_matrix) * 25)
+    size = _effective_block_size(len(corr_matrix), block_size, max_vars)
+
+    if threshold is not None:
+        strong = np.abs(corr_matrix.to_numpy()) >= threshold
+        corr_matrix = corr_matrix.where(strong)
+        if drilldown is None and size == 1:
+            # Quitar variables cuya única correlación fuerte es consigo mismas
+            off_diagonal = strong & ~np.eye(len(strong), dtype=bool)
+            keep = off_diagonal.any(axis=0)
+            corr_matrix = corr_matrix.loc[keep, keep]
+        title += f" - |r| ≥ {threshold}"
+
+    if drilldown is not None:
+        # Detalle de un cruce de bloques a resolución completa
+        blocks = get_variable_blocks(df, size)
+        rows, cols = blocks[drilldown[0]], blocks[drilldown[1]]
+        corr_matrix = corr_matrix.loc[rows, cols]
+        title += f" - Bloques {drilldown[0]} x {drilldown[1]}"
+    elif size > 1:
+        blocks = get_variable_blocks(df, size)
+        labels = [f"{b[0]}…{b[-1]}" if len(b) > 1 else b[0] for b in blocks]
+        corr_matrix = pd.DataFrame(_aggregate_blocks(corr_matrix.to_numpy(), size, block_agg),
+                                   index=labels, columns=labels)
+        title += f" - Bloques de {size} variables ({block_agg})"
+
+    if corr_matrix.empty or corr_matrix.isna().all().all():
+        # Nada que dibujar: figura vacía con el motivo
+        if n_numeric == 0:
+            message = "No hay variables numéricas para calcular correlaciones."
+        elif threshold is not None:
+            message = f"Ninguna correlación cumple |r| ≥ {threshold}. Prueba con un umbral menor."
+        else:
+            message = "No hay correlaciones entre variables distintas para mostrar."
+        fig = go.Figure()
+        fig.add_annotation(
+            text=message,
+            showarrow=False, xref="paper", yref="paper", x=0.5, y=0.5, font=dict(size=16)
+        )
+        fig.update_xaxes(visible=False)
+        fig.update_yaxes(visible=False)
+        fig.update_layout(title=title, height=600, template="plotly_white")
+        return fig
+
+    dynamic_height = max(600, min(max(corr_matrix.shape), max_vars) * 25)
     
     fig = px.imshow(
         corr_matrix,
@@ -27,7 +147,7 @@ def plot_correlation_heatmap(df: pd.DataFrame, method: str = 'pearson') -> go.Fi
         aspect="auto",
         color_continuous_scale='RdBu_r',
         zmin=-1, zmax=1,
-        title=f"Matriz de Correlación Interactiva ({method.capitalize()})"
+        title=title
     )
     
     fig.update_layout(
@@ -36,6 +156,6 @@ def plot_correlation_heatmap(df: pd.DataFrame, method: str = 'pearson') -> go.Fi
         autosize=False
     )
     
-    fig.update_traces(hovertemplate='Variable X: %{x}<br>Variable Y: %{y}<br>Correlación: %{z}')
+    fig.update_traces(hovertemplate='Variable X: %{x}<br>Variable Y: %{y}<br>Correlación: %{z:.2f}')
     
     return fig
\ No newline at end of file
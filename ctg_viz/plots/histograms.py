@@ -1,9 +1,51 @@
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+from plotly.subplots import make_subplots
 from typing import Optional
 
-def plot_histogram_interactivo(df: pd.DataFrame, col: str, group_by: Optional[str] = None) -> go.Figure:
+def _plot_histogram_from_cube(cube: dict, col: str, group_by: Optional[str] = None) -> go.Figure:
+    """
+    Helper interno que dibuja el histograma (y su boxplot marginal) a partir de
+    los conteos por bin y los cuartiles precalculados en el cubo.
+    """
+    edges = cube["bin_edges"][col]
+    centers = (edges[:-1] + edges[1:]) / 2
+    widths = edges[1:] - edges[:-1]
+    counts = cube["histograms"][(col, group_by)]
+    stats = cube["stats"][(col, group_by)]
+    colors = px.colors.qualitative.Plotly
+
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.2, 0.8], vertical_spacing=0.03)
+    for i, group in enumerate(counts.index):
+        color = colors[i % len(colors)]
+        name = str(group)
+        row = stats.loc[group]
+        fig.add_trace(go.Box(
+            y=[name], orientation="h",
+            q1=[row["q1"]], median=[row["median"]], q3=[row["q3"]],
+            lowerfence=[row["lowerfence"]], upperfence=[row["upperfence"]],
+            name=name, legendgroup=name, showlegend=False, marker_color=color
+        ), row=1, col=1)
+        fig.add_trace(go.Bar(
+            x=centers, y=counts.loc[group].to_numpy(), width=widths,
+            name=name, legendgroup=name, showlegend=group_by is not None,
+            opacity=0.7, marker_color=color
+        ), row=2, col=1)
+
+    fig.update_yaxes(showticklabels=False, row=1, col=1)
+    fig.update_xaxes(title_text=col, row=2, col=1)
+    fig.update_yaxes(title_text="count", row=2, col=1)
+    fig.update_layout(
+        barmode="overlay",
+        bargap=0.1,
+        title=f"Distribución de {col}",
+        legend_title_text=group_by,
+        template="plotly_white"
+    )
+    return fig
+
+def plot_histogram_interactivo(df: pd.DataFrame, col: str, group_by: Optional[str] = None, cube: Optional[dict] = None) -> go.Figure:
     """
     Histograma interactivo con gráfico marginal de caja (Boxplot superior).
     El gráfico permite agrupar por una variable categórica opcional.
@@ -13,9 +55,14 @@ def plot_histogram_interactivo(df: pd.DataFrame, col: str, group_by: Optional[st
         df (pd.DataFrame): Datos.
         col (str): Variable numérica.
         group_by (str, optional): Variable categórica para agrupar colores.
+        cube (dict, optional): Cubo de `build_summary_cube`. Si contiene el par
+                               (col, group_by) se usan sus conteos por bin.
     Returns:
         go.Figure: Gráfico interactivo.
     """
+    if cube is not None and (col, group_by) in cube["histograms"]:
+        return _plot_histogram_from_cube(cube, col, group_by)
+
     fig = px.histogram(
         df, 
         x=col, 
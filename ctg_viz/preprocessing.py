@@ -9,12 +9,84 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Tuple, Union, List
 
+from ctg_viz.backend import is_arrow, arrow_array, from_arrow, null_count, nunique
+
+def _arrow_fill_median(series: pd.Series) -> pd.Series:
+    """
+    Helper interno: imputación por mediana con kernels de Arrow
+    (`quantile` + `fill_null`). Las enteras pasan a double como en NumPy.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    array = arrow_array(series)
+    if array.null_count == 0:
+        return series
+    if pa.types.is_integer(array.type):
+        array = pc.cast(array, pa.float64())
+    median = pc.quantile(array, q=0.5, interpolation="linear")[0]
+    return from_arrow(pc.fill_null(array, median), series)
+
+def _arrow_fill_mode(series: pd.Series) -> pd.Series:
+    """
+    Helper interno: imputación por moda con kernels de Arrow (`value_counts`).
+    Ante empates toma el valor menor, igual que `Series.mode()[0]`.
+    """
+    import pyarrow.compute as pc
+    array = arrow_array(series)
+    if array.null_count == 0:
+        return series
+    counts = pc.value_counts(pc.drop_null(array))
+    if len(counts) == 0:
+        return series
+    top = pc.filter(counts.field("values"), pc.equal(counts.field("counts"), pc.max(counts.field("counts"))))
+    return from_arrow(pc.fill_null(array, pc.min(top)), series)
+
+def _arrow_clip_outliers(series: pd.Series, method: str) -> Tuple[pd.Series, float, float]:
+    """
+    Helper interno: límites (`quantile` o `mean`/`stddev`) y recorte
+    (`max_element_wise`/`min_element_wise`) con kernels de Arrow.
+    Los nulos se conservan y las enteras pasan a double como en NumPy.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    array = pc.cast(arrow_array(series), pa.float64())
+
+    lower_bound, upper_bound = 0, 0
+    if method == 'iqr':
+        Q1, Q3 = pc.quantile(array, q=[0.25, 0.75], interpolation="linear").to_pylist()
+        IQR = Q3 - Q1
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+    elif method == 'z-score':
+        mean = pc.mean(array).as_py()
+        std = pc.stddev(array, ddof=1).as_py()
+        lower_bound = mean - 3 * std
+        upper_bound = mean + 3 * std
+
+    clipped = pc.min_element_wise(pc.max_element_wise(array, lower_bound, skip_nulls=False),
+                                  upper_bound, skip_nulls=False)
+    return from_arrow(clipped, series), lower_bound, upper_bound
+
 def _is_continuous(series: pd.Series, threshold: int = 10) -> bool:
     """
     Helper interno para determinar si una columna es 'Continua' 
     según la regla del proyecto: Numérica y > 10 valores únicos.
     """
-    return pd.api.types.is_numeric_dtype(series) and series.nunique() > threshold
+    return pd.api.types.is_numeric_dtype(series) and nunique(series) > threshold
+
+def to_arrow_backend(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convierte un DataFrame a tipos respaldados por Arrow (`int64[pyarrow]`,
+    `double[pyarrow]`, `string[pyarrow]`...). Todas las funciones de este
+    módulo aceptan el resultado y producen los mismos valores que con NumPy.
+    Requiere el paquete opcional `pyarrow`.
+
+    Args:
+        df (pd.DataFrame): Dataset con tipos NumPy.
+    Returns:
+        pd.DataFrame: Dataset con tipos Arrow.
+    """
+    return df.convert_dtypes(dtype_backend="pyarrow")
 
 def remove_null_columns(df: pd.DataFrame, threshold: float = 0.2) -> pd.DataFrame:
     """
@@ -30,7 +102,7 @@ def remove_null_columns(df: pd.DataFrame, threshold: float = 0.2) -> pd.DataFram
                              Si False, devuelve solo el DataFrame.
 
     """
-    null_percentages = df.isnull().mean()
+    null_percentages = pd.Series({col: null_count(df[col]) for col in df.columns}, dtype=float) / max(len(df), 1)
     cols_to_keep = null_percentages[null_percentages <= threshold].index
     return df[cols_to_keep].copy()
 
@@ -65,17 +137,25 @@ def impute_missing_values(df: pd.DataFrame, use_knn: bool = False) -> pd.DataFra
     if use_knn and cols_continuous:
         from sklearn.impute import KNNImputer
         imputer = KNNImputer(n_neighbors=5)
+        arrow_cols = [c for c in cols_continuous if is_arrow(df_clean[c])]
         # KNN devuelve array, asignamos con cuidado para no perder índice
         df_clean[cols_continuous] = imputer.fit_transform(df_clean[cols_continuous])
+        for col in arrow_cols:
+            df_clean[col] = df_clean[col].astype("double[pyarrow]")
     else:
         # Fallback a Mediana para continuas
         for col in cols_continuous:
-            df_clean[col] = df_clean[col].fillna(df_clean[col].median())
+            if is_arrow(df_clean[col]):
+                df_clean[col] = _arrow_fill_median(df_clean[col])
+            else:
+                df_clean[col] = df_clean[col].fillna(df_clean[col].median())
 
     # 3. Imputación de Discretas/Categóricas (SIEMPRE MODA)
     # Esto protege variables como NSP (1,2,3) de recibir decimales
     for col in cols_discrete:
-        if not df_clean[col].mode().empty:
+        if is_arrow(df_clean[col]):
+            df_clean[col] = _arrow_fill_mode(df_clean[col])
+        elif not df_clean[col].mode().empty:
             moda = df_clean[col].mode()[0]
             df_clean[col] = df_clean[col].fillna(moda)
                     
@@ -109,23 +189,27 @@ def detect_handle_outliers(
     
     for col in cols_to_process:
         original_data = df_out[col].copy()
-        
-        # 2. Cálculo de límites
-        lower_bound, upper_bound = 0, 0
-        if method == 'iqr':
-            Q1 = df_out[col].quantile(0.25)
-            Q3 = df_out[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-        elif method == 'z-score':
-            mean = df_out[col].mean()
-            std = df_out[col].std()
-            lower_bound = mean - 3 * std
-            upper_bound = mean + 3 * std
-            
-        # 3. Tratamiento (Clipping)
-        df_out[col] = np.clip(df_out[col], lower_bound, upper_bound)
+
+        if is_arrow(df_out[col]):
+            # Ruta Arrow: límites y recorte con kernels de pyarrow.compute
+            df_out[col], lower_bound, upper_bound = _arrow_clip_outliers(df_out[col], method)
+        else:
+            # 2. Cálculo de límites
+            lower_bound, upper_bound = 0, 0
+            if method == 'iqr':
+                Q1 = df_out[col].quantile(0.25)
+                Q3 = df_out[col].quantile(0.75)
+                IQR = Q3 - Q1
+                lower_bound = Q1 - 1.5 * IQR
+                upper_bound = Q3 + 1.5 * IQR
+            elif method == 'z-score':
+                mean = df_out[col].mean()
+                std = df_out[col].std()
+                lower_bound = mean - 3 * std
+                upper_bound = mean + 3 * std
+
+            # 3. Tratamiento (Clipping)
+            df_out[col] = np.clip(df_out[col], lower_bound, upper_bound)
         
         # 4. Generación de Gráficos (Opcional)
         if return_plots:
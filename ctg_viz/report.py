@@ -0,0 +1,329 @@
+import pandas as pd
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ctg_viz.preprocessing import _is_continuous, detect_handle_outliers
+from ctg_viz.plots.histograms import plot_histogram_interactivo
+from ctg_viz.plots.boxplots import plot_boxplot
+from ctg_viz.plots.density import plot_violin
+from ctg_viz.plots.heatmap import plot_correlation_heatmap
+
+# Se incrementa cuando cambia la forma de dibujar, para invalidar exportaciones previas
+REPORT_VERSION = "1"
+MANIFEST_NAME = "manifest.json"
+
+def _safe_name(name: str) -> str:
+    """
+    Helper interno que convierte el nombre de una figura en un nombre de archivo válido.
+    """
+    return re.sub(r"[^0-9A-Za-z_.-]+", "_", name)
+
+
+def _fingerprint(df: pd.DataFrame, params: dict) -> str:
+    """
+    Helper interno que genera la huella (sha256) de los datos usados por una
+    figura junto con sus parámetros de dibujo.
+    """
+    digest = hashlib.sha256()
+    digest.update(REPORT_VERSION.encode())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    digest.update(json.dumps([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _plan_figures(
+    df_clean: pd.DataFrame,
+    df_final: pd.DataFrame,
+    method: str,
+    group_by: Optional[str]
+) -> List[Tuple[str, str, dict, pd.DataFrame]]:
+    """
+    Helper interno que enumera todas las figuras del reporte.
+
+    Cada figura se dibuja exactamente con los datos de su tupla, que son
+    también los que se usan para su huella.
+
+    Returns:
+        list: Tuplas (nombre, tipo, parámetros, datos de los que depende la figura).
+    """
+    extra = [group_by] if group_by else []
+    tasks = []
+
+    # Comparativa antes/después del tratamiento de outliers (matplotlib): se
+    # enumera como lo hace `detect_handle_outliers`, sobre los datos sin recortar
+    for col in [c for c in df_clean.columns if _is_continuous(df_clean[c]) and c != group_by]:
+        tasks.append((f"outliers_{col}", "outliers", {"col": col, "method": method}, df_clean[[col]]))
+
+    continuous = [c for c in df_final.columns if _is_continuous(df_final[c]) and c != group_by]
+    for col in continuous:
+        data = df_final[[col] + extra]
+        tasks.append((f"histogram_{col}", "histogram", {"col": col, "group_by": group_by}, data))
+        if group_by:
+            tasks.append((f"boxplot_{col}", "boxplot", {"x": group_by, "y": col}, data))
+            # El violin muestra todas las columnas en el hover: depende del dataset completo
+            tasks.append((f"violin_{col}", "violin", {"x": group_by, "y": col}, df_final))
+
+    numeric = df_final.select_dtypes(include=["number"])
+    for corr_method in ["pearson", "spearman"]:
+        tasks.append((f"heatmap_{corr_method}", "heatmap", {"method": corr_method}, numeric))
+
+    return tasks
+
+
+def _matplotlib_to_html(fig, title: str) -> str:
+    """
+    Helper interno que incrusta una figura de matplotlib (PNG en base64) en una
+    página HTML independiente.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight")
+    encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+    return (
+        f"<html><head><meta charset='utf-8'><title>{html.escape(title)}</title></head>"
+        f"<body><img src='data:image/png;base64,{encoded}'/></body></html>"
+    )
+
+
+def _render_figure(
+    name: str,
+    kind: str,
+    params: dict,
+    df: pd.DataFrame,
+    output_dir: str,
+    formats: Sequence[str],
+    include_plotlyjs
+) -> List[str]:
+    """
+    Helper interno ejecutado en los workers: dibuja una figura con los datos
+    recibidos y la guarda en cada formato solicitado. Si falla a medias (p. ej.
+    el PNG tras escribir el HTML) borra lo ya escrito antes de propagar el error.
+
+    Returns:
+        list: Rutas de los archivos escritos.
+    """
+    paths = []
+    try:
+        _write_figure(name, kind, params, df, os.path.join(output_dir, _safe_name(name)),
+                      formats, include_plotlyjs, paths)
+    except Exception:
+        _remove_files(paths)
+        raise
+    return paths
+
+
+def _write_figure(
+    name: str,
+    kind: str,
+    params: dict,
+    df: pd.DataFrame,
+    base: str,
+    formats: Sequence[str],
+    include_plotlyjs,
+    paths: List[str]
+) -> None:
+    """
+    Helper interno que dibuja la figura y agrega a `paths` cada archivo escrito.
+    """
+    if kind == "outliers":
+        import matplotlib.pyplot as plt
+        col = params["col"]
+        _, figs = detect_handle_outliers(df, method=params["method"], return_plots=True)
+        if col not in figs:
+            # Variable sin outliers: no hay comparativa que exportar
+            return
+        fig = figs[col]
+        if "png" in formats:
+            fig.savefig(base + ".png", bbox_inches="tight")
+            paths.append(base + ".png")
+        if "html" in formats:
+            with open(base + ".html", "w", encoding="utf-8") as f:
+                f.write(_matplotlib_to_html(fig, name))
+            paths.append(base + ".html")
+        plt.close(fig)
+        return
+
+    if kind == "histogram":
+        fig = plot_histogram_interactivo(df, col=params["col"], group_by=params["group_by"])
+    elif kind == "boxplot":
+        fig = plot_boxplot(df, x=params["x"], y=params["y"])
+    elif kind == "violin":
+        fig = plot_violin(df, x=params["x"], y=params["y"])
+    elif kind == "heatmap":
+        fig = plot_correlation_heatmap(df, method=params["method"])
+    else:
+        raise ValueError(f"Tipo de figura desconocido: {kind}")
+
+    if "html" in formats:
+        fig.write_html(base + ".html", include_plotlyjs=include_plotlyjs)
+        paths.append(base + ".html")
+    if "png" in formats:
+        # Requiere el paquete opcional `kaleido`
+        fig.write_image(base + ".png")
+        paths.append(base + ".png")
+
+
+def _remove_files(paths: Sequence[str]) -> None:
+    """
+    Helper interno que borra los archivos indicados que existan.
+    """
+    for path in paths:
+        if os.path.isfile(path):
+            os.remove(path)
+
+
+def _write_index(output_dir: str, entries: Dict[str, List[str]], errors: Optional[Dict[str, str]] = None) -> str:
+    """
+    Helper interno que escribe la página índice con un enlace por archivo exportado
+    y, si las hay, la lista de figuras que fallaron.
+    """
+    sections = {}
+    for name, paths in sorted(entries.items()):
+        kind = name.split("_", 1)[0]
+        for path in paths:
+            rel = os.path.basename(path)
+            sections.setdefault(kind, []).append(f"<li><a href='{html.escape(rel)}'>{html.escape(rel)}</a></li>")
+
+    body = "".join(
+        f"<h2>{html.escape(kind.capitalize())}</h2><ul>{''.join(items)}</ul>"
+        for kind, items in sections.items()
+    )
+    if errors:
+        failed = "".join(f"<li>{html.escape(name)}: {html.escape(msg)}</li>" for name, msg in sorted(errors.items()))
+        body += f"<h2>Errores</h2><ul>{failed}</ul>"
+    index_path = os.path.join(output_dir, "index.html")
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write(
+            "<html><head><meta charset='utf-8'><title>Reporte CTG</title></head>"
+            f"<body><h1>Reporte CTG</h1>{body}</body></html>"
+        )
+    return index_path
+
+
+def export_report(
+    df: pd.DataFrame,
+    output_dir: str,
+    method: str = 'iqr',
+    group_by: Optional[str] = 'NSP',
+    formats: Sequence[str] = ("html",),
+    max_workers: Optional[int] = None,
+    include_plotlyjs="cdn",
+    force: bool = False
+) -> Dict[str, str]:
+    """
+    Exporta todas las figuras del análisis a archivos estáticos (HTML/PNG) más
+    una página `index.html`, dibujándolas en paralelo con un pool de procesos.
+    Las figuras cuya huella (datos + parámetros) no cambió desde la última
+    exportación se omiten, según el `manifest.json` de la carpeta de salida.
+    Los archivos de figuras que se redibujan o que ya no forman parte del
+    reporte se borran, para no dejar resultados viejos junto a los nuevos.
+
+    Figuras generadas:
+    - Comparativa de outliers de cada variable continua (`detect_handle_outliers`).
+    - Histograma, boxplot y violin por variable continua, segmentados por `group_by`.
+    - Heatmaps de correlación Pearson y Spearman.
+
+    Args:
+        df (pd.DataFrame): Dataset limpio e imputado (antes del tratamiento de outliers).
+        output_dir (str): Carpeta de salida (se crea si no existe).
+        method (str): Método de outliers, 'iqr' o 'z-score'.
+        group_by (str, optional): Variable discreta para segmentar. Si es None
+                                  sólo se exportan histogramas sin agrupar.
+        formats (list): Formatos a generar: 'html' y/o 'png' (PNG de Plotly requiere `kaleido`).
+        max_workers (int, optional): Procesos del pool. None usa el número de CPUs.
+        include_plotlyjs: Se pasa a `write_html`. 'cdn' genera archivos ligeros,
+                          True incrusta plotly.js para abrirlos sin conexión.
+        force (bool): Si es True se vuelven a dibujar todas las figuras.
+    Returns:
+        dict: Estado de cada figura: 'rendered', 'skipped', 'empty' (sin outliers)
+              o 'failed' (error al dibujar; se lista en el índice y se reintenta
+              en la siguiente exportación).
+    """
+    if group_by is not None and group_by not in df.columns:
+        group_by = None
+
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+    df_final = detect_handle_outliers(df, method=method)
+    formats = tuple(formats)
+    tasks = _plan_figures(df, df_final, method, group_by)
+
+    # 1. Decidir qué figuras hay que volver a dibujar
+    status, pending, new_manifest, errors = {}, [], {}, {}
+    for name, kind, params, data in tasks:
+        fingerprint = _fingerprint(data, {"kind": kind, "formats": formats,
+                                          "include_plotlyjs": include_plotlyjs, **params})
+        previous = manifest.get(name)
+        if (previous and not force and previous["fingerprint"] == fingerprint
+                and all(os.path.exists(p) for p in previous["files"])):
+            status[name] = "skipped"
+            new_manifest[name] = previous
+        else:
+            pending.append((name, kind, params, data, fingerprint))
+
+    # Archivos de la exportación anterior que ya no son válidos: los de las
+    # figuras a redibujar (pueden quedar vacías o fallar) y los de figuras que
+    # dejaron de existir (p. ej. una columna eliminada)
+    stale = [entry for name, entry in manifest.items() if name not in new_manifest]
+    _remove_files([os.path.join(output_dir, os.path.basename(p)) for entry in stale for p in entry["files"]])
+
+    # 2. Dibujar en paralelo las pendientes
+    if pending:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                name: (fingerprint, pool.submit(_render_figure, name, kind, params, data,
+                                                output_dir, formats, include_plotlyjs))
+                for name, kind, params, data, fingerprint in pending
+            }
+            for name, (fingerprint, future) in futures.items():
+                try:
+                    paths = future.result()
+                except Exception as error:
+                    # Una figura fallida no detiene el reporte; no entra al manifiesto
+                    # para que se vuelva a intentar en la siguiente exportación
+                    status[name] = "failed"
+                    errors[name] = f"{type(error).__name__}: {error}"
+                    continue
+                status[name] = "rendered" if paths else "empty"
+                new_manifest[name] = {"fingerprint": fingerprint, "files": paths}
+
+    # 3. Índice y manifiesto (sólo con las figuras que se exportaron bien)
+    _write_index(output_dir, {name: entry["files"] for name, entry in new_manifest.items()}, errors)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(new_manifest, f, indent=2)
+
+    return status
+
+
+if __name__ == "__main__":
+    import argparse
+    from ctg_viz.preprocessing import remove_null_columns, impute_missing_values
+
+    parser = argparse.ArgumentParser(description="Exporta todas las figuras CTG a archivos estáticos.")
+    parser.add_argument("csv", help="Ruta del CSV de entrada.")
+    parser.add_argument("output_dir", help="Carpeta de salida.")
+    parser.add_argument("--method", default="iqr", choices=["iqr", "z-score"])
+    parser.add_argument("--group-by", default="NSP")
+    parser.add_argument("--formats", nargs="+", default=["html"], choices=["html", "png"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    data = pd.read_csv(args.csv)
+    data = impute_missing_values(remove_null_columns(data, threshold=0.2))
+    result = export_report(data, args.output_dir, method=args.method, group_by=args.group_by,
+                           formats=args.formats, max_workers=args.workers, force=args.force)
+    counts = pd.Series(result).value_counts()
+    print(counts.to_string())
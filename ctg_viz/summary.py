@@ -0,0 +1,275 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional
+
+from ctg_viz.preprocessing import _is_continuous
+
+# Etiqueta del grupo único cuando no se segmenta por ninguna variable discreta
+TOTAL_LABEL = "Total"
+
+
+def _hazen_quantiles(values: pd.DataFrame, keys: pd.Series, qs: List[float]) -> Dict[float, pd.DataFrame]:
+    """
+    Helper interno que calcula cuantiles por grupo con la convención de Plotly
+    (posición `q*n - 0.5`, tipo 5 de Hyndman-Fan / `np.quantile(method="hazen")`),
+    en lugar de la interpolación lineal (tipo 7) de pandas.
+    Se ordena una sola vez por (grupo, valor) y se indexa cada cuantil.
+
+    Returns:
+        Dict[float, pd.DataFrame]: Un DataFrame por cuantil (índice = grupo,
+                                   columnas = variables continuas).
+    """
+    group_codes, groups = pd.factorize(keys, sort=True)
+    n_groups = len(groups)
+    result = {q: {} for q in qs}
+
+    for col in values.columns:
+        data = values[col].to_numpy(dtype=float)
+        valid = (group_codes >= 0) & ~np.isnan(data)
+        codes, data = group_codes[valid], data[valid]
+        ordered = data[np.lexsort((data, codes))]
+        counts = np.bincount(codes, minlength=n_groups)
+        starts = np.cumsum(counts) - counts
+        last = np.maximum(counts - 1, 0)
+
+        for q in qs:
+            pos = np.clip(q * counts - 0.5, 0, last)
+            lo = np.floor(pos).astype(int)
+            hi = np.minimum(lo + 1, last)
+            frac = pos - lo
+            # Los grupos sin datos quedan en NaN
+            padded = np.append(ordered, np.nan)
+            empty = counts == 0
+            low_vals = padded[np.where(empty, ordered.size, starts + lo)]
+            high_vals = padded[np.where(empty, ordered.size, starts + hi)]
+            result[q][col] = low_vals + frac * (high_vals - low_vals)
+
+    return {q: pd.DataFrame(cols, index=groups) for q, cols in result.items()}
+
+
+def _silverman_bandwidth(std, iqr, count) -> np.ndarray:
+    """
+    Helper interno: ancho de banda de Silverman, la misma regla que usa Plotly
+    en `px.violin` (0.9 * min(std, IQR/1.349) * n^-0.2).
+    """
+    std, iqr, count = (np.asarray(a, dtype=float) for a in (std, iqr, count))
+    spread = np.fmin(std, iqr / 1.349)
+    # Con IQR = 0 se usa la desviación estándar
+    spread = np.where(spread > 0, spread, std)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 0.9 * spread * np.power(count, -0.2)
+
+
+def _group_kde(
+    data: np.ndarray,
+    group_codes: np.ndarray,
+    n_groups: int,
+    grid: np.ndarray,
+    bandwidth: np.ndarray
+) -> np.ndarray:
+    """
+    Helper interno que evalúa la densidad (KDE gaussiano) de cada grupo sobre
+    la malla compartida. Los pares (grupo, valor) repetidos se agrupan con su
+    frecuencia como peso, así la matriz (valor x punto de la malla) sólo tiene
+    los valores distintos. Fuera del rango [min - 2h, max + 2h] de cada grupo
+    la densidad queda en NaN, igual que el `span` "soft" de Plotly.
+
+    Returns:
+        np.ndarray: Matriz (grupo x punto de la malla).
+    """
+    valid = (group_codes >= 0) & np.isfinite(data)
+    codes, data = group_codes[valid], data[valid]
+    step = grid[1] - grid[0] if len(grid) > 1 else 1.0
+    # Grupos constantes (h = 0) se suavizan con el paso de la malla
+    bandwidth = np.where(np.isfinite(bandwidth) & (bandwidth > 0), bandwidth, step)
+
+    distinct, value_codes = np.unique(data, return_inverse=True)
+    pairs, weights = np.unique(codes.astype(np.int64) * len(distinct) + value_codes, return_counts=True)
+    pair_codes, pair_values = pairs // len(distinct), distinct[pairs % len(distinct)]
+    h = bandwidth[pair_codes][:, None]
+    z = (grid[None, :] - pair_values[:, None]) / h
+    kernel = np.exp(-0.5 * z * z) / (h * np.sqrt(2 * np.pi))
+
+    membership = np.zeros((n_groups, len(pairs)))
+    membership[pair_codes, np.arange(len(pairs))] = weights
+    counts = membership.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        density = (membership @ kernel) / counts[:, None]
+
+    low = np.full(n_groups, np.inf)
+    high = np.full(n_groups, -np.inf)
+    np.minimum.at(low, codes, data)
+    np.maximum.at(high, codes, data)
+    span = (grid[None, :] >= (low - 2 * bandwidth)[:, None]) & (grid[None, :] <= (high + 2 * bandwidth)[:, None])
+    return np.where(span, density, np.nan)
+
+
+def _group_stats(values: pd.DataFrame, keys: pd.Series) -> Dict[str, pd.DataFrame]:
+    """
+    Helper interno que calcula en una sola pasada los estadísticos de caja
+    (conteo, media, cuartiles y bigotes) de todas las columnas continuas
+    para cada grupo definido por `keys`. Cuartiles, bigotes y outliers siguen
+    la misma convención que `px.box`.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Un DataFrame por estadístico (índice = grupo,
+                                 columnas = variables continuas).
+    """
+    grouped = values.groupby(keys, sort=True)
+    quantiles = _hazen_quantiles(values, keys, [0.25, 0.5, 0.75])
+    q1 = quantiles[0.25]
+    median = quantiles[0.5]
+    q3 = quantiles[0.75]
+    iqr = q3 - q1
+
+    # Límites de Tukey alineados fila a fila con el dataset original
+    lower_rows = (q1 - 1.5 * iqr).reindex(keys).to_numpy()
+    upper_rows = (q3 + 1.5 * iqr).reindex(keys).to_numpy()
+    inside = (values >= lower_rows) & (values <= upper_rows)
+
+    # Los bigotes llegan al dato más extremo dentro de los límites (igual que Plotly)
+    return {
+        "count": grouped.count(),
+        "mean": grouped.mean(),
+        "std": grouped.std(),
+        "min": grouped.min(),
+        "q1": q1,
+        "median": median,
+        "q3": q3,
+        "max": grouped.max(),
+        "lowerfence": values.where(inside).groupby(keys, sort=True).min(),
+        "upperfence": values.where(inside).groupby(keys, sort=True).max(),
+        "outlier_mask": (~inside) & values.notna(),
+    }
+
+
+def _histogram_counts(codes: np.ndarray, group_codes: np.ndarray, n_groups: int, nbins: int) -> np.ndarray:
+    """
+    Helper interno que cuenta las observaciones por (grupo, bin) con un único
+    `np.bincount`. Las filas con código -1 (nulos) se descartan.
+    """
+    valid = (codes >= 0) & (group_codes >= 0)
+    flat = group_codes[valid] * nbins + codes[valid]
+    return np.bincount(flat, minlength=n_groups * nbins).reshape(n_groups, nbins)
+
+
+def build_summary_cube(
+    df: pd.DataFrame,
+    continuous: Optional[List[str]] = None,
+    discrete: Optional[List[str]] = None,
+    nbins: int = 50,
+    max_groups: int = 50,
+    density_points: int = 100
+) -> Dict:
+    """
+    Precalcula un "cubo" de resúmenes para cada par (continua x discreta).
+    Se construye una sola vez por dataset limpio y las funciones de graficado
+    lo consultan con el argumento `cube`, de modo que cambiar de variable en
+    el dashboard es una búsqueda en diccionario y no un nuevo agrupamiento.
+
+    Args:
+        df (pd.DataFrame): Dataset ya procesado.
+        continuous (list, optional): Variables continuas. Si es None se detectan
+                                     con la regla del proyecto (> 10 únicos).
+        discrete (list, optional): Variables discretas/categóricas. Si es None
+                                   son todas las columnas no continuas.
+        nbins (int): Número de bins de los histogramas. Default es 50.
+        max_groups (int): Máximo de grupos por variable discreta. Las columnas
+                          tipo identificador (`SegFile`, `FileName`, `Date`...)
+                          lo superan, se omiten del cubo y los gráficos usan
+                          para ellas la ruta directa con el DataFrame.
+        density_points (int): Puntos de la malla donde se evalúa la densidad
+                              (KDE) de cada grupo para los violines.
+    Returns:
+        dict: Cubo con las llaves:
+            - 'stats': {(continua, discreta|None): DataFrame por grupo con
+              count, mean, std, min, q1, median, q3, max, lowerfence, upperfence}.
+            - 'outliers': {(continua, discreta|None): {grupo: np.ndarray}}.
+            - 'histograms': {(continua, discreta|None): DataFrame grupo x bin}.
+            - 'bin_edges': {continua: np.ndarray con los bordes compartidos}.
+            - 'densities': {(continua, discreta|None): DataFrame grupo x punto
+              de la malla con la densidad KDE (NaN fuera del rango del grupo)}.
+            - 'density_grid': {continua: np.ndarray con la malla compartida}.
+            - 'value_counts': {discreta: pd.Series de frecuencias}.
+            - 'skipped': Variables discretas omitidas por superar `max_groups`.
+    """
+    if continuous is None:
+        continuous = [c for c in df.columns if _is_continuous(df[c])]
+    if discrete is None:
+        discrete = [c for c in df.columns if c not in continuous]
+    skipped = [c for c in discrete if df[c].nunique() > max_groups]
+    discrete = [c for c in discrete if c not in skipped]
+
+    values = df[continuous].astype(float)
+    cube = {
+        "continuous": list(continuous),
+        "discrete": list(discrete),
+        "skipped": skipped,
+        "nbins": nbins,
+        "stats": {},
+        "outliers": {},
+        "histograms": {},
+        "bin_edges": {},
+        "densities": {},
+        "density_grid": {},
+        "value_counts": {},
+    }
+
+    # 1. Bordes de bin compartidos por todos los grupos de cada variable continua
+    bin_codes = {}
+    for col in continuous:
+        data = values[col].to_numpy()
+        finite = data[np.isfinite(data)]
+        edges = np.histogram_bin_edges(finite, bins=nbins) if finite.size else np.linspace(0, 1, nbins + 1)
+        codes = np.searchsorted(edges, data, side="right") - 1
+        codes[codes == nbins] = nbins - 1  # El borde derecho pertenece al último bin
+        codes[~np.isfinite(data)] = -1
+        cube["bin_edges"][col] = edges
+        bin_codes[col] = codes
+
+        # Malla de densidad: rango de los datos más 3 anchos de banda globales
+        if finite.size:
+            q1, q3 = np.quantile(finite, [0.25, 0.75], method="hazen")
+            h = _silverman_bandwidth(finite.std(ddof=1) if finite.size > 1 else 0, q3 - q1, finite.size)
+            pad = 3 * float(h) if np.isfinite(h) and h > 0 else 1.0
+            grid = np.linspace(finite.min() - pad, finite.max() + pad, density_points)
+        else:
+            grid = np.linspace(0, 1, density_points)
+        cube["density_grid"][col] = grid
+
+    # 2. Resúmenes por cada segmentación (None = sin agrupar)
+    for disc in [None] + list(discrete):
+        if disc is None:
+            keys = pd.Series(TOTAL_LABEL, index=df.index)
+        else:
+            keys = df[disc]
+            cube["value_counts"][disc] = keys.value_counts()
+
+        if not continuous:
+            continue
+
+        stats = _group_stats(values, keys)
+        outlier_mask = stats.pop("outlier_mask")
+        # Columnas (estadístico, variable): una sola tabla en lugar de una por variable
+        combined = pd.concat(stats, axis=1)
+        group_codes, groups = pd.factorize(keys, sort=True)
+
+        for col in continuous:
+            cube["stats"][(col, disc)] = combined.xs(col, axis=1, level=1)
+
+            mask = outlier_mask[col].to_numpy()
+            cube["outliers"][(col, disc)] = {
+                group: vals.to_numpy()
+                for group, vals in values.loc[mask, col].groupby(keys[mask], sort=True)
+            } if mask.any() else {}
+
+            counts = _histogram_counts(bin_codes[col], group_codes, len(groups), nbins)
+            cube["histograms"][(col, disc)] = pd.DataFrame(counts, index=groups)
+
+            col_stats = cube["stats"][(col, disc)].reindex(groups)
+            bandwidth = _silverman_bandwidth(col_stats["std"], col_stats["q3"] - col_stats["q1"], col_stats["count"])
+            density = _group_kde(values[col].to_numpy(), group_codes, len(groups),
+                                 cube["density_grid"][col], bandwidth)
+            cube["densities"][(col, disc)] = pd.DataFrame(density, index=groups)
+
+    return cube
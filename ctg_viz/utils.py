@@ -1,11 +1,14 @@
 import pandas as pd
 import numpy as np
 
+from ctg_viz import backend
+
 def check_data_completeness_JosueJimenezApodaca(df: pd.DataFrame) -> pd.DataFrame:
     """
     Analiza el dataset y retorna un resumen de completitud, tipos y estadísticas.
     Cumple con los requisitos de conteo de nulos, porcentajes, tipos y 
     clasificación automática de variables continuas/discretas.
+    Acepta DataFrames con tipos NumPy o Arrow (ver `to_arrow_backend`).
     
     Args:
         df (pd.DataFrame): El dataset a analizar.
@@ -18,7 +21,7 @@ def check_data_completeness_JosueJimenezApodaca(df: pd.DataFrame) -> pd.DataFram
     
     for col in df.columns:
         # 1. Conteo de nulos 
-        null_count = df[col].isnull().sum()
+        null_count = backend.null_count(df[col])
         
         # 2. Porcentaje de completitud 
         # Completitud = 100% - %Nulos
@@ -37,7 +40,7 @@ def check_data_completeness_JosueJimenezApodaca(df: pd.DataFrame) -> pd.DataFram
         # 5. Clasificar automáticamente columnas 
         # - Continuas: Más de 10 valores únicos y tipo numérico 
         # - Discretas: Menos de 10 valores únicos 
-        unique_vals = df[col].nunique()
+        unique_vals = backend.nunique(df[col])
         
         if pd.api.types.is_numeric_dtype(df[col]) and unique_vals > 10:
             category = "Continua"
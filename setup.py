@@ -26,4 +26,7 @@ setup(
         "pytest",
         "nbconvert"
     ],
+    extras_require={
+        "arrow": ["pyarrow"]
+    },
 )
\ No newline at end of file
@@ -0,0 +1,102 @@
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ctg_viz.plots.heatmap import plot_correlation_heatmap, get_variable_blocks
+
+# --- FIXTURES (Datos de prueba) ---
+@pytest.fixture
+def wide_df():
+    """
+    Genera un DataFrame sintético con muchas variables numéricas.
+
+    Returns:
+        pd.DataFrame: 250 variables aleatorias independientes, salvo 'v1'
+                      que es una transformación lineal de 'v0' (r = 1).
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(200, 250)), columns=[f"v{i}" for i in range(250)])
+    df['v1'] = df['v0'] * 2 + 1
+    return df
+
+# --- PRUEBAS UNITARIAS ---
+
+def test_heatmap_aggregates_large_matrix(wide_df):
+    """
+    Valida que la matriz se agregue en bloques cuando supera `max_vars`.
+
+    Resultado Esperado:
+        - 250 variables con max_vars=100 se agrupan en bloques de 3 (84 por lado).
+        - La matriz enviada a Plotly es float32.
+        - Con 'max_abs' el bloque que contiene v0 y v1 conserva la correlación 1.
+    """
+    fig = plot_correlation_heatmap(wide_df, max_vars=100, block_agg='max_abs')
+    z = fig.data[0].z
+    assert z.shape == (84, 84)
+    assert z.dtype == np.float32
+    assert z[0, 0] == pytest.approx(1.0)
+
+def test_heatmap_threshold_and_drilldown(wide_df):
+    """
+    Valida la sparsificación por umbral y el detalle de un cruce de bloques.
+
+    Resultado Esperado:
+        - Con threshold=0.9 sin agrupar sólo quedan v0 y v1.
+        - El drill-down del bloque 0 muestra sus variables a resolución completa.
+    """
+    fig = plot_correlation_heatmap(wide_df, threshold=0.9, max_vars=500)
+    assert list(fig.data[0].x) == ['v0', 'v1']
+
+    blocks = get_variable_blocks(wide_df, 10)
+    fig = plot_correlation_heatmap(wide_df, block_size=10, drilldown=(0, 1))
+    assert list(fig.data[0].y) == blocks[0]
+    assert list(fig.data[0].x) == blocks[1]
+
+
+def test_heatmap_empty_threshold_shows_message(wide_df):
+    """
+    Valida el caso en que ninguna correlación supera el umbral.
+
+    Escenario:
+        Se quita 'v1' (única correlación fuerte) y se pide threshold=0.9.
+
+    Resultado Esperado:
+        - No se dibuja ningún heatmap vacío; la figura contiene un aviso.
+    """
+    fig = plot_correlation_heatmap(wide_df.drop(columns='v1'), threshold=0.9, max_vars=500)
+    assert len(fig.data) == 0
+    assert 'Ninguna correlación' in fig.layout.annotations[0].text
+
+def test_heatmap_empty_without_threshold_shows_reason():
+    """
+    Valida el aviso cuando no hay nada que dibujar y no se usó umbral.
+
+    Escenario:
+        - DataFrame sin columnas numéricas.
+        - DataFrame con una sola variable numérica (sólo la diagonal).
+
+    Resultado Esperado:
+        - El aviso explica el motivo y no menciona ningún umbral.
+    """
+    fig = plot_correlation_heatmap(pd.DataFrame({'txt': ['a', 'b', 'c']}))
+    assert len(fig.data) == 0
+    assert 'No hay variables numéricas' in fig.layout.annotations[0].text
+
+    fig = plot_correlation_heatmap(pd.DataFrame({'v0': [1.0, 2.0, 3.0]}), block_size=2)
+    assert len(fig.data) == 0
+    assert 'None' not in fig.layout.annotations[0].text
+    assert 'variables distintas' in fig.layout.annotations[0].text
+
+def test_variable_blocks_default_is_automatic(wide_df):
+    """
+    Valida que `get_variable_blocks` sin `block_size` use el mismo tamaño
+    automático que el heatmap (250 variables con max_vars=100 -> bloques de 3).
+    """
+    blocks = get_variable_blocks(wide_df)
+    assert len(blocks) == 84
+    assert blocks[0] == ['v0', 'v1', 'v2']
\ No newline at end of file
@@ -7,7 +7,7 @@ import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from ctg_viz.preprocessing import remove_null_columns, impute_missing_values, detect_handle_outliers
+from ctg_viz.preprocessing import remove_null_columns, impute_missing_values, detect_handle_outliers, to_arrow_backend
 from ctg_viz.utils import check_data_completeness_JosueJimenezApodaca
 
 # --- FIXTURES (Datos de prueba) ---
@@ -130,4 +130,51 @@ def test_check_data_completeness_structure(sample_df):
     assert summary.loc['col_outlier', 'Categoría Auto'] == 'Continua'
     
     # col_cat tiene 2 valores únicos -> Debe ser Discreta
-    assert summary.loc['col_cat', 'Categoría Auto'] == 'Discreta'
\ No newline at end of file
+    assert summary.loc['col_cat', 'Categoría Auto'] == 'Discreta'
+
+def test_arrow_backend_matches_numpy(sample_df):
+    """
+    Valida que la ruta Arrow produzca los mismos resultados que la ruta NumPy.
+
+    Escenario:
+        Se ejecuta el pipeline completo sobre el DataFrame de prueba original
+        y sobre su versión convertida con `to_arrow_backend`.
+
+    Resultado Esperado:
+        - Mismas columnas conservadas y mismos valores tras imputar y recortar
+          outliers (métodos 'iqr' y 'z-score'), sin salir de los tipos Arrow.
+        - Mismo conteo de nulos y misma clasificación en el reporte de completitud.
+    """
+    pytest.importorskip("pyarrow")
+    df_arrow = to_arrow_backend(sample_df)
+    assert isinstance(df_arrow['col_good'].dtype, pd.ArrowDtype)
+
+    for method in ['iqr', 'z-score']:
+        out_numpy = detect_handle_outliers(impute_missing_values(remove_null_columns(sample_df)), method=method)
+        out_arrow = detect_handle_outliers(impute_missing_values(remove_null_columns(df_arrow)), method=method)
+
+        assert list(out_numpy.columns) == list(out_arrow.columns)
+        for col in ['col_good', 'col_outlier']:
+            np.testing.assert_allclose(out_numpy[col].to_numpy(float), out_arrow[col].to_numpy(float))
+            assert isinstance(out_arrow[col].dtype, pd.ArrowDtype)
+        assert out_numpy['col_cat'].tolist() == out_arrow['col_cat'].tolist()
+
+    cols = ['Nulos', 'Categoría Auto']
+    pd.testing.assert_frame_equal(check_data_completeness_JosueJimenezApodaca(sample_df)[cols],
+                                  check_data_completeness_JosueJimenezApodaca(df_arrow)[cols])
+def test_impute_string_column_keeps_dtype():
+    """
+    Valida la imputación por moda de columnas de texto respaldadas por Arrow
+    (el tipo `str` por defecto de pandas 3).
+
+    Resultado Esperado:
+        - Mismo resultado que con la columna como `object`, empate resuelto al menor.
+        - La columna conserva su tipo de texto.
+    """
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({'col_txt': pd.Series(['b', 'a', None, 'a', 'b'], dtype='string[pyarrow]')})
+
+    out = impute_missing_values(df)
+    assert out['col_txt'].tolist() == impute_missing_values(df.astype(object))['col_txt'].tolist()
+    assert out['col_txt'].tolist() == ['b', 'a', 'a', 'a', 'b']
+    assert out['col_txt'].dtype == df['col_txt'].dtype
@@ -0,0 +1,168 @@
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+import json
+
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ctg_viz.report import export_report, _plan_figures, _render_figure
+
+# --- FIXTURES (Datos de prueba) ---
+@pytest.fixture
+def report_df():
+    """
+    Genera un DataFrame sintético pequeño para exportar el reporte.
+
+    Returns:
+        pd.DataFrame: Dataset con:
+            - 'LB': Numérica continua con un outlier (500).
+            - 'ASTV': Numérica continua sin outliers.
+            - 'NSP': Discreta con las clases 1, 2 y 3.
+            - 'FileName': Texto (sólo aparece en el hover del violin).
+    """
+    lb = np.arange(30, dtype=float)
+    lb[-1] = 500
+    return pd.DataFrame({
+        'LB': lb,
+        'ASTV': np.linspace(10, 80, 30),
+        'NSP': [1, 2, 3] * 10,
+        'FileName': [f"f{i}.txt" for i in range(30)]
+    })
+
+# --- PRUEBAS UNITARIAS ---
+
+def test_export_report_skips_unchanged_figures(report_df, tmp_path):
+    """
+    Valida la exportación en paralelo y la omisión de figuras sin cambios.
+
+    Escenario:
+        Se exporta dos veces el mismo dataset, después se modifica 'ASTV' y
+        finalmente sólo una columna de texto.
+
+    Resultado Esperado:
+        - La primera vez se dibujan todas las figuras y se crea el índice.
+        - 'ASTV' no tiene outliers, por lo que su comparativa queda vacía.
+        - La segunda vez todas se omiten.
+        - Al cambiar 'ASTV' se dibujan de nuevo sus figuras, los heatmaps y todos
+          los violines (su hover incluye todas las columnas).
+        - Al cambiar sólo el texto se dibujan de nuevo únicamente los violines.
+    """
+    first = export_report(report_df, str(tmp_path), max_workers=2)
+    assert first['histogram_LB'] == 'rendered'
+    assert first['outliers_LB'] == 'rendered'
+    assert first['outliers_ASTV'] == 'empty'
+    assert (tmp_path / 'index.html').exists()
+    assert (tmp_path / 'heatmap_spearman.html').exists()
+
+    second = export_report(report_df, str(tmp_path), max_workers=2)
+    assert set(second.values()) == {'skipped'}
+
+    changed = report_df.copy()
+    changed.loc[0, 'ASTV'] = 5
+    third = export_report(changed, str(tmp_path), max_workers=2)
+    rendered = {name for name, state in third.items() if state != 'skipped'}
+    assert rendered == {'outliers_ASTV', 'histogram_ASTV', 'boxplot_ASTV', 'violin_ASTV',
+                        'violin_LB', 'heatmap_pearson', 'heatmap_spearman'}
+
+    changed.loc[0, 'FileName'] = 'otro.txt'
+    fourth = export_report(changed, str(tmp_path), max_workers=2)
+    rendered = {name for name, state in fourth.items() if state != 'skipped'}
+    assert rendered == {'violin_ASTV', 'violin_LB'}
+    assert 'otro.txt' in (tmp_path / 'violin_LB.html').read_text(encoding='utf-8')
+
+
+def test_export_report_records_failed_figures(report_df, tmp_path):
+    """
+    Valida que un error al dibujar una figura no detenga la exportación.
+
+    Escenario:
+        Se crea una carpeta con el nombre del archivo de 'histogram_LB', de modo
+        que escribirlo falla (igual que un 'png' sin `kaleido`).
+
+    Resultado Esperado:
+        - 'histogram_LB' queda como 'failed' y el resto se exporta.
+        - Se escriben igualmente `index.html` y `manifest.json` sin las fallidas.
+    """
+    (tmp_path / 'histogram_LB.html').mkdir()
+    result = export_report(report_df, str(tmp_path), max_workers=2)
+    assert result['histogram_LB'] == 'failed'
+    assert result['outliers_LB'] == 'rendered'
+    assert result['boxplot_LB'] == 'rendered'
+
+    index = (tmp_path / 'index.html').read_text(encoding='utf-8')
+    assert 'boxplot_LB.html' in index
+    assert 'Errores' in index
+
+    manifest = json.loads((tmp_path / 'manifest.json').read_text(encoding='utf-8'))
+    assert 'outliers_LB' in manifest
+    assert 'histogram_LB' not in manifest
+
+def test_plan_outliers_from_raw_continuity():
+    """
+    Valida que las comparativas de outliers se planeen con los datos sin recortar.
+
+    Escenario:
+        'DP' tiene 11 valores distintos (0..8 más 1000 y 2000). Al recortar,
+        los dos outliers quedan en el mismo límite y sólo restan 10 valores.
+
+    Resultado Esperado:
+        - Se planea 'outliers_DP' aunque 'DP' ya no sea continua tras el recorte.
+        - No se planea su histograma (se enumera con los datos finales).
+    """
+    from ctg_viz.preprocessing import detect_handle_outliers
+    df = pd.DataFrame({'DP': [float(v) for v in range(9)] * 5 + [1000.0, 2000.0]})
+    df_final = detect_handle_outliers(df, method='iqr')
+    names = [task[0] for task in _plan_figures(df, df_final, 'iqr', None)]
+
+    assert 'outliers_DP' in names
+    assert 'histogram_DP' not in names
+
+
+def test_export_report_removes_stale_files(report_df, tmp_path):
+    """
+    Valida que no queden archivos de exportaciones anteriores que ya no aplican.
+
+    Escenario:
+        Se exporta, luego se quita el outlier de 'LB' y se elimina 'ASTV'.
+
+    Resultado Esperado:
+        - 'outliers_LB' pasa a 'empty' y su archivo anterior se borra.
+        - Los archivos de 'ASTV' se borran y salen del manifiesto.
+    """
+    export_report(report_df, str(tmp_path), max_workers=2)
+    assert (tmp_path / 'outliers_LB.html').exists()
+    assert (tmp_path / 'histogram_ASTV.html').exists()
+
+    changed = report_df.drop(columns='ASTV')
+    changed.loc[29, 'LB'] = 29
+    result = export_report(changed, str(tmp_path), max_workers=2)
+
+    assert result['outliers_LB'] == 'empty'
+    assert not (tmp_path / 'outliers_LB.html').exists()
+    assert not list(tmp_path.glob('*ASTV*'))
+    manifest = json.loads((tmp_path / 'manifest.json').read_text(encoding='utf-8'))
+    assert not any('ASTV' in name for name in manifest)
+
+def test_render_figure_cleans_partial_output(report_df, tmp_path, monkeypatch):
+    """
+    Valida que una figura que falla a medias no deje archivos sueltos.
+
+    Escenario:
+        El HTML se escribe bien pero el PNG falla (como sin `kaleido`).
+
+    Resultado Esperado:
+        - Se propaga el error y el HTML ya escrito se borra.
+    """
+    import plotly.graph_objects as go
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("sin kaleido")
+
+    monkeypatch.setattr(go.Figure, 'write_image', fail)
+    with pytest.raises(RuntimeError):
+        _render_figure('histogram_LB', 'histogram', {'col': 'LB', 'group_by': 'NSP'},
+                       report_df[['LB', 'NSP']], str(tmp_path), ('html', 'png'), 'cdn')
+    assert not list(tmp_path.iterdir())
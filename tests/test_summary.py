@@ -0,0 +1,144 @@
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ctg_viz.summary import build_summary_cube, TOTAL_LABEL
+from ctg_viz.plots.boxplots import plot_boxplot
+from ctg_viz.plots.histograms import plot_histogram_interactivo
+from ctg_viz.plots.density import plot_violin
+from ctg_viz.plots.barplots import plot_bar
+
+# --- FIXTURES (Datos de prueba) ---
+@pytest.fixture
+def grouped_df():
+    """
+    Genera un DataFrame sintético con una variable continua y una discreta.
+
+    Returns:
+        pd.DataFrame: Dataset con:
+            - 'LB': Numérica continua (valores 0 a 39) con un valor extremo.
+            - 'NSP': Discreta con las clases 1, 2 y 3.
+    """
+    lb = np.arange(40, dtype=float)
+    lb[-1] = 500
+    nsp = np.array([1, 2, 3, 1] * 10)
+    return pd.DataFrame({'LB': lb, 'NSP': nsp})
+
+# --- PRUEBAS UNITARIAS ---
+
+def test_summary_cube_matches_groupby(grouped_df):
+    """
+    Valida que los estadísticos del cubo coincidan con un groupby directo.
+
+    Resultado Esperado:
+        - Conteos, medias y medianas iguales a los de pandas por cada clase NSP.
+        - Los histogramas suman el número de filas de cada grupo.
+        - El valor extremo (500) aparece como outlier de su grupo.
+    """
+    cube = build_summary_cube(grouped_df, continuous=['LB'], discrete=['NSP'])
+    stats = cube['stats'][('LB', 'NSP')]
+    expected = grouped_df.groupby('NSP')['LB']
+
+    pd.testing.assert_series_equal(stats['count'], expected.count(), check_names=False, check_dtype=False)
+    pd.testing.assert_series_equal(stats['mean'], expected.mean(), check_names=False)
+    pd.testing.assert_series_equal(stats['median'], expected.median(), check_names=False)
+
+    hist = cube['histograms'][('LB', 'NSP')]
+    assert hist.sum(axis=1).tolist() == expected.count().tolist()
+    assert cube['histograms'][('LB', None)].loc[TOTAL_LABEL].sum() == len(grouped_df)
+
+    assert 500 in cube['outliers'][('LB', 'NSP')][1]
+    assert cube['value_counts']['NSP'][1] == 20
+
+def test_summary_cube_quartiles_follow_plotly():
+    """
+    Valida que los cuartiles usen la convención de `px.box` (Hazen, tipo 5)
+    y no la interpolación lineal de pandas.
+
+    Escenario:
+        Grupo 'A' con valores [0, 1, 2, 3]: pandas da Q1 = 0.75, Plotly da Q1 = 0.5.
+
+    Resultado Esperado:
+        - Q1, mediana y Q3 iguales a `np.quantile(..., method="hazen")` por grupo.
+    """
+    df = pd.DataFrame({
+        'LB': [0, 1, 2, 3, 10, 13, 20, 21, 22, 40, 41, 42, 43],
+        'CLASS': ['A'] * 4 + ['B'] * 5 + ['C'] * 4
+    })
+    cube = build_summary_cube(df, continuous=['LB'], discrete=['CLASS'])
+    stats = cube['stats'][('LB', 'CLASS')]
+
+    assert stats.loc['A', 'q1'] == pytest.approx(0.5)
+    for group, values in df.groupby('CLASS')['LB']:
+        expected = np.quantile(values, [0.25, 0.5, 0.75], method='hazen')
+        np.testing.assert_allclose(stats.loc[group, ['q1', 'median', 'q3']].to_numpy(float), expected)
+
+def test_plots_read_from_cube(grouped_df):
+    """
+    Valida que las funciones de graficado acepten el cubo y generen figuras.
+
+    Resultado Esperado:
+        - Cada gráfico devuelve una figura con al menos una traza por grupo.
+    """
+    cube = build_summary_cube(grouped_df, continuous=['LB'], discrete=['NSP'])
+
+    assert len(plot_boxplot(grouped_df, x='NSP', y='LB', cube=cube).data) >= 3
+    assert len(plot_histogram_interactivo(grouped_df, col='LB', group_by='NSP', cube=cube).data) == 6
+    assert len(plot_violin(grouped_df, x='NSP', y='LB', cube=cube, points=False).data) == 6
+    assert len(plot_violin(grouped_df, x='NSP', y='LB', cube=cube).data) == 9
+    assert len(plot_bar(grouped_df, col='NSP', cube=cube).data) >= 1
+
+
+def test_summary_cube_density_matches_kde(grouped_df):
+    """
+    Valida la densidad de los violines contra un KDE gaussiano directo.
+
+    Escenario:
+        - Se calcula el KDE de cada grupo con el ancho de banda de Silverman.
+
+    Resultado Esperado:
+        - Coincide con la densidad del cubo dentro del rango de cada grupo.
+        - La densidad integra aproximadamente 1.
+    """
+    cube = build_summary_cube(grouped_df, continuous=['LB'], discrete=['NSP'])
+    grid = cube['density_grid']['LB']
+    densities = cube['densities'][('LB', 'NSP')]
+
+    for group, values in grouped_df.groupby('NSP')['LB']:
+        values = values.to_numpy(float)
+        q1, q3 = np.quantile(values, [0.25, 0.75], method='hazen')
+        h = 0.9 * min(values.std(ddof=1), (q3 - q1) / 1.349) * len(values) ** -0.2
+        z = (grid[:, None] - values[None, :]) / h
+        expected = np.exp(-0.5 * z ** 2).sum(axis=1) / (len(values) * h * np.sqrt(2 * np.pi))
+
+        density = densities.loc[group].to_numpy()
+        inside = np.isfinite(density)
+        np.testing.assert_allclose(density[inside], expected[inside])
+
+    total = np.nansum(densities.to_numpy(), axis=1) * (grid[1] - grid[0])
+    np.testing.assert_allclose(total, 1, atol=0.05)
+
+
+def test_summary_cube_skips_high_cardinality(grouped_df):
+    """
+    Valida que las columnas tipo identificador no entren al cubo.
+
+    Escenario:
+        Se agrega 'SegFile' con un valor distinto por fila (40 grupos) y max_groups=10.
+
+    Resultado Esperado:
+        - 'SegFile' queda en 'skipped' y no genera pares en el cubo.
+        - El boxplot por 'SegFile' usa la ruta directa y sigue funcionando.
+    """
+    df = grouped_df.assign(SegFile=[f"CTG{i:04d}.txt" for i in range(len(grouped_df))])
+    cube = build_summary_cube(df, continuous=['LB'], discrete=['NSP', 'SegFile'], max_groups=10)
+
+    assert cube['skipped'] == ['SegFile']
+    assert ('LB', 'SegFile') not in cube['stats']
+    assert ('LB', 'NSP') in cube['stats']
+    assert len(plot_boxplot(df, x='SegFile', y='LB', cube=cube).data) >= 1
\ No newline at end of file